@@ -0,0 +1,18 @@
+# coding=utf-8
+""" Constants shared across django_wikidata_api modules. """
+import sys
+
+# Interned so the many f-strings and cache keys built around these short strings share one object,
+# and so the URL-stripping fast path can slice with a precomputed length.
+WIKIDATA_PROP_PREFIX = sys.intern("wdt")
+WIKIDATA_ENTITY_PREFIX = sys.intern("wd")
+WIKIDATA_ENTITY_PREFIX_URL = sys.intern("http://www.wikidata.org/entity/")
+WIKIDATA_ENTITY_PREFIX_URL_LEN = len(WIKIDATA_ENTITY_PREFIX_URL)
+
+DEFAULT_LANGUAGE = 'en'
+
+# Wikidata Query Service SPARQL endpoint; queries are POSTed here by models.WikidataItemBase.
+WIKIDATA_SPARQL_ENDPOINT = "https://query.wikidata.org/sparql"
+WIKIDATA_SPARQL_USER_AGENT = "django-wikidata-api/0.0.1 (https://github.com/kennethsn/django-wikidata-api)"
+# MediaWiki action API; used for the wbgetentities fast path on label-shaped models.
+WIKIDATA_API_ENDPOINT = "https://www.wikidata.org/w/api.php"
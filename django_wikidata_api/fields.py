@@ -1,197 +1,301 @@
+import re
+import sys
+
 from rest_framework import serializers
 
-from .serializers import WikidataConformanceSerializer
-from .utils import (
-    get_wikidata_field,
-    set_kwargs
+from .constants import (
+    DEFAULT_LANGUAGE,
+    WIKIDATA_ENTITY_PREFIX,
+    WIKIDATA_ENTITY_PREFIX_URL,
+    WIKIDATA_ENTITY_PREFIX_URL_LEN,
+    WIKIDATA_PROP_PREFIX
 )
+from .serializers import WikidataConformanceSerializer
+
+WIKIDATA_ENTITY_REGEX = r"(Q|q)\d+"
+# Colon-suffixed prefix forms as they appear in rendered SPARQL.
+_PROP_PREFIX = f"{WIKIDATA_PROP_PREFIX}:"
+_ENTITY_PREFIX = f"{WIKIDATA_ENTITY_PREFIX}:"
+# Compiled once at import so per-row parsing doesn't pay a re.compile/cache lookup per value.
+_ENTITY_RE = re.compile(WIKIDATA_ENTITY_REGEX)
 
 # TODO: Fields
 # BindField - Example: BIND(wd:Q937 AS ?item).
 
 
+def render_fields(fields):
+    """
+    Render the SPARQL fragments for a collection of fields in one pass.
+    Notes:
+        Query builders need all four clause types; collecting them in a single iteration avoids four
+        separate passes (and four sets of attribute lookups) over the field list.
+    Args:
+        fields (Iterable[WikidataField]): Bound fields to render
+
+    Returns (Tuple[str, str, str, str]): Space-joined field, filter, service, and group clauses
+
+    """
+    field_parts = []
+    filter_parts = []
+    service_parts = []
+    group_parts = []
+    for field in fields:
+        if field.no_sparql:
+            continue
+        field_parts.append(field.to_wikidata_field())
+        filter_parts.append(field.to_wikidata_filter())
+        service_parts.append(field.to_wikidata_service())
+        group_parts.append(field.to_wikidata_group())
+    return ' '.join(field_parts), ' '.join(filter_parts), ' '.join(service_parts), ' '.join(group_parts)
+
+
 class WikidataField(object):
-    name = None
+    # Field instances are created in bulk at model-class definition time; __slots__ keeps them small
+    # and makes the hot-path attribute loads C-level slot lookups instead of __dict__ probes.
+    __slots__ = ('name', 'entity_name', 'properties', 'values', 'default', 'required', 'public', '_from_name',
+                 '_serializer', '_serializer_settings', 'separator', 'wikidata_filter', '_prop_sparql',
+                 '_sparql_field', '_sparql_filter', '_sparql_service', '_sparql_group')
     serializer_class = serializers.Field
     default_serializer_settings = {}
-    serializer = None
+    suffix = ''
+    no_sparql = False
 
     def __init__(self, properties=None, values=None, default=None, required=False, entity_name='main',
-                 serializer_settings=None, **kwargs):
-        self.entity_name = entity_name
+                 public=None, serializer_settings=None, **kwargs):
+        self.name = None
+        self.public = public
+        # Interned so the repeated f-string/dict-key uses of the entity name share one object.
+        self.entity_name = sys.intern(entity_name)
         self.properties = properties
+        # Properties are fixed after construction, so the pipe-joined SPARQL form is computed once here.
+        self._prop_sparql = _PROP_PREFIX + f"|{_PROP_PREFIX}".join(properties) if properties else None
         self.values = values
         self.default = default
         self.required = required
-        set_kwargs(self, kwargs)
+        self._from_name = None
+        self._sparql_field = None
+        self._sparql_filter = None
+        self._sparql_service = None
+        self._sparql_group = None
+        if kwargs:
+            raise TypeError(f"Unknown field kwargs: {list(kwargs)}")
         self.set_serializer(serializer_settings or {})
 
     def __repr__(self):
         return "<{}: {}>".format(self.__class__.__name__, self.name)
 
+    @property
+    def from_name(self):
+        """ SPARQL variable this field is read back from; derived lazily since most fields never use it. """
+        from_name = self._from_name
+        if from_name is None:
+            from_name = self._from_name = f"{self.entity_name}{self.suffix}"
+        return from_name
+
+    def set_name(self, name):
+        """
+        Bind this field to the attribute name it was declared under on the model.
+        Args:
+            name (str): Attribute name on the owning model class
+
+        """
+        self.name = name
+        if self.public is None:
+            # Inlined private-name check (vs. a helper call); this runs once per field per model class.
+            self.public = not (name and name[0] == '_')
+        self._build_fragments()
+
     def set_serializer(self, serializer_settings):
         for key, value in self.default_serializer_settings.items():
             if key not in serializer_settings:
                 serializer_settings[key] = value
-        self.serializer = self.serializer_class(**serializer_settings)
+        # DRF Field construction is comparatively heavy (validator binding, default copies), and
+        # query-only callers never touch it; keep the settings and build the serializer on demand.
+        self._serializer_settings = serializer_settings
+        self._serializer = None
+
+    @property
+    def serializer(self):
+        """ DRF serializer field for this field; instantiated on first access and cached. """
+        serializer = self._serializer
+        if serializer is None:
+            serializer = self._serializer = self.serializer_class(**self._serializer_settings)
+        return serializer
 
     def _prop_sparql_string(self):
-        return "wdt:{}".format('|wdt:'.join(self.properties))
+        return self._prop_sparql
+
+    def _build_fragments(self):
+        """
+        Precompute the SPARQL fragments this field contributes to a query.
+        Notes:
+            Fragments only depend on the field's settings and its bound name, so they are built once per
+            name binding and the to_wikidata_* accessors become plain attribute reads on the query path.
+
+        """
+        wd_triple = f"?{self.entity_name} {self._prop_sparql} ?{self.name}."
+        self._sparql_field = f"?{self.name}"
+        self._sparql_filter = wd_triple if self.required else f"OPTIONAL {{ {wd_triple} }}"
+        self._sparql_service = ""
+        self._sparql_group = ""
 
     def to_wikidata_field(self):
-        return "?{self.name}".format(self=self)
+        if self._sparql_field is None:
+            self._build_fragments()
+        return self._sparql_field
 
     def to_wikidata_filter(self):
-        prop_string = self._prop_sparql_string()
-        wd_triple = "?{self.entity_name} {props} ?{self.name}.".format(self=self, props=prop_string)
-        return wd_triple if self.required else "OPTIONAL {{}}".format(wd_triple)
+        if self._sparql_field is None:
+            self._build_fragments()
+        return self._sparql_filter
 
     def to_wikidata_service(self):
-        return ""
+        if self._sparql_field is None:
+            self._build_fragments()
+        return self._sparql_service
 
     def to_wikidata_group(self):
-        return ""
+        if self._sparql_field is None:
+            self._build_fragments()
+        return self._sparql_group
 
     def from_wikidata(self, wikidata_response):
-        return get_wikidata_field(wikidata_response, self.name, self.default)
+        # Inlined dict lookups; this runs once per field per response row.
+        entry = wikidata_response.get(self.name)
+        if entry is None:
+            return self.default
+        return entry.get('value', self.default)
+
+
+class WikidataNoSPARQLMixin(object):
+    """ Mixin for fields that are response-side only and contribute nothing to the SPARQL query. """
+    __slots__ = ()
+    no_sparql = True
+
+    def _build_fragments(self):
+        self._sparql_field = self._sparql_filter = self._sparql_service = self._sparql_group = ""
 
 
 class WikidataListResponseMixin(object):
-    separator = '|'
-    name = None
-    default = None
+    __slots__ = ()
     serializer_class = serializers.ListField
     default_serializer_settings = {'allow_null': True, 'allow_empty': True}
 
     def from_wikidata(self, wikidata_response):
-        field = get_wikidata_field(wikidata_response, self.name, self.default)
-        return field.split(self.separator) if field else self.default
+        # Inlined (rather than get_wikidata_field) since this runs once per list field per response row.
+        entry = wikidata_response.get(self.name)
+        value = entry.get('value') if entry is not None else None
+        return value.split(self.separator) if value else self.default
 
 
 class WikidataStringField(WikidataField):
-    pass
+    __slots__ = ()
 
 
 class WikidataLabelField(WikidataField):
+    __slots__ = ()
     suffix = 'Label'
     serializer_class = serializers.CharField
     default_serializer_settings = {'allow_null': False, 'allow_blank': False}
 
-    def __init__(self, **kwargs):
-        super(WikidataLabelField, self).__init__(**kwargs)
-        self.from_name = "{}{}".format(self.entity_name, self.suffix)
-
-    def to_wikidata_field(self):
-        return "?{self.from_name} (?{self.from_name} AS ?{self.name})".format(self=self)
-
-    def to_wikidata_filter(self):
-        return ''  # Labels are not in the WHERE clause in a SPARQL query
-
-    def to_wikidata_service(self):
+    def _build_fragments(self):
+        from_name = self.from_name
+        self._sparql_field = f"?{from_name} (?{from_name} AS ?{self.name})"
+        self._sparql_filter = ''  # Labels are not in the WHERE clause in a SPARQL query
         # TODO: Merge similarities with entity list label
-        return "?{self.entity_name} rdfs:label ?{self.from_name} . ".format(self=self)
-
-    def to_wikidata_group(self):
-        return "?{self.from_name}".format(self=self)
+        self._sparql_service = f"?{self.entity_name} rdfs:label ?{from_name} . "
+        self._sparql_group = f"?{from_name}"
 
 
 class WikidataEntityField(WikidataField):
     # TODO: Add Item and Property SubClasses
+    __slots__ = ()
     serializer_class = serializers.RegexField
-    default_serializer_settings = {'allow_blank': False, 'regex': "(Q|q)\d+", 'min_length': 2, 'max_length': 20,
-                                   'help_text': "Wikidata Item Identifier (ex. Q59961716)"}
-    wikidata_filter = None
+    default_serializer_settings = {'allow_blank': False, 'regex': WIKIDATA_ENTITY_REGEX, 'min_length': 2,
+                                   'max_length': 20, 'help_text': "Wikidata Item Identifier (ex. Q59961716)"}
 
     def __init__(self, triples, **kwargs):
         super(WikidataEntityField, self).__init__(**kwargs)
         self.wikidata_filter = " ".join(triple.format(self.entity_name) for triple in triples)
 
-    def to_wikidata_filter(self):
-        return self.wikidata_filter if self.required else "OPTIONAL {{ {} }}".format(self.wikidata_filter)
-
-    def to_wikidata_group(self):
-        return "?{self.name}".format(self=self)
+    def _build_fragments(self):
+        self._sparql_field = f"?{self.name}"
+        self._sparql_filter = self.wikidata_filter if self.required else f"OPTIONAL {{ {self.wikidata_filter} }}"
+        self._sparql_service = ""
+        self._sparql_group = f"?{self.name}"
 
     def from_wikidata(self, wikidata_response):
         field = super(WikidataEntityField, self).from_wikidata(wikidata_response)
-        return field.replace('http://www.wikidata.org/entity/', '')
+        if field and field.startswith(WIKIDATA_ENTITY_PREFIX_URL):
+            # Almost every binding is a clean entity URL; slicing skips the regex engine entirely.
+            return field[WIKIDATA_ENTITY_PREFIX_URL_LEN:]
+        match = _ENTITY_RE.search(field) if field else None
+        return match.group(0) if match else field
 
 
 class WikidataEntityFilterField(WikidataField):
-    def to_wikidata_filter(self):
-        prop_string = self._prop_sparql_string()
-        wd_filter = "?{self.entity_name} {props} ?{self.name}_qid. FILTER(?{self.name}_qid=wd:{vals}).".format(
-            self=self, props=prop_string, vals="|| ?{self.name}_qid=wd:".join(self.values)).format(self=self)
-        return wd_filter if self.required else "OPTIONAL {{ {} }}".format(wd_filter)
+    __slots__ = ()
 
-    def to_wikidata_service(self):
+    def _build_fragments(self):
+        vals = " || ".join(f"?{self.name}_qid={_ENTITY_PREFIX}{val}" for val in self.values)
+        wd_filter = f"?{self.entity_name} {self._prop_sparql} ?{self.name}_qid. FILTER({vals})."
+        self._sparql_field = f"?{self.name}"
+        self._sparql_filter = wd_filter if self.required else f"OPTIONAL {{ {wd_filter} }}"
         # TODO: Merge similarities with entity list label
-        return "?{self.name}_qid rdfs:label ?{self.name} . ".format(self=self)
-
-    def to_wikidata_group(self):
-        return "?{self.name}".format(self=self)
+        self._sparql_service = f"?{self.name}_qid rdfs:label ?{self.name} . "
+        self._sparql_group = f"?{self.name}"
 
 
 class WikidataListField(WikidataListResponseMixin, WikidataField):
+    __slots__ = ()
+
     def __init__(self, properties=None, empty=True, separator='|', **kwargs):
-        self.separator = separator
+        # Single-character separators hit str.split's dedicated fast path in the per-row parser.
+        assert len(separator) == 1, "separator must be a single character"
+        self.separator = sys.intern(separator)
         if empty:
             kwargs['default'] = []
         super(WikidataListField, self).__init__(properties, **kwargs)
 
-    def to_wikidata_field(self):
-        return "(GROUP_CONCAT(DISTINCT ?{self.name}_item; SEPARATOR='{self.separator}') AS ?{self.name})".format(
-            self=self)
-
-    def to_wikidata_filter(self):
-        prop_string = self._prop_sparql_string()
-        wd_filter = "?{self.entity_name} {props} ?{self.name}_item .".format(self=self, props=prop_string)
-        return wd_filter if self.required else "OPTIONAL {{ {} }}".format(wd_filter)
+    def _build_fragments(self):
+        wd_filter = f"?{self.entity_name} {self._prop_sparql} ?{self.name}_item ."
+        self._sparql_field = f"(GROUP_CONCAT(DISTINCT ?{self.name}_item; SEPARATOR='{self.separator}') AS " \
+                             f"?{self.name})"
+        self._sparql_filter = wd_filter if self.required else f"OPTIONAL {{ {wd_filter} }}"
+        self._sparql_service = ""
+        self._sparql_group = ""
 
 
 class WikidataAltLabelField(WikidataListField):
+    __slots__ = ()
     suffix = '_alt_label'
 
-    def to_wikidata_field(self):
-        return "(GROUP_CONCAT(DISTINCT ?{self.entity_name}_alt_label; SEPARATOR='{self.separator}') AS " \
-               "?{self.name})".format(self=self)
-
-    def to_wikidata_filter(self):
+    def _build_fragments(self):
         # TODO: add language support in here
-        wd_filter = "?{self.entity_name} skos:altLabel ?{self.entity_name}_alt_label ." \
-               "FILTER (lang(?{self.entity_name}_alt_label)='en')".format(self=self)
-        return wd_filter if self.required else "OPTIONAL {{ {} }}".format(wd_filter)
+        wd_filter = f"?{self.entity_name} skos:altLabel ?{self.entity_name}_alt_label ." \
+                    f"FILTER (lang(?{self.entity_name}_alt_label)='{DEFAULT_LANGUAGE}')"
+        self._sparql_field = f"(GROUP_CONCAT(DISTINCT ?{self.entity_name}_alt_label; " \
+                             f"SEPARATOR='{self.separator}') AS ?{self.name})"
+        self._sparql_filter = wd_filter if self.required else f"OPTIONAL {{ {wd_filter} }}"
+        self._sparql_service = ""
+        self._sparql_group = ""
 
 
 class WikidataEntityListField(WikidataListField):
+    __slots__ = ()
+
     def __init__(self, properties=None, **kwargs):
         assert properties, "There must be a list/tuple of properties"
         super(WikidataEntityListField, self).__init__(properties, **kwargs)
 
-    def to_wikidata_field(self):
-        return "(GROUP_CONCAT(DISTINCT ?{self.name}_itemLabel; SEPARATOR='{self.separator}') AS ?{self.name})".format(
-            self=self)
-
-    def to_wikidata_service(self):
-        return "?{self.name}_item rdfs:label ?{self.name}_itemLabel . ".format(self=self)
+    def _build_fragments(self):
+        super(WikidataEntityListField, self)._build_fragments()
+        self._sparql_field = f"(GROUP_CONCAT(DISTINCT ?{self.name}_itemLabel; SEPARATOR='{self.separator}') AS " \
+                             f"?{self.name})"
+        self._sparql_service = f"?{self.name}_item rdfs:label ?{self.name}_itemLabel . "
 
 
-class WikidataConformanceField(WikidataField):
+class WikidataConformanceField(WikidataNoSPARQLMixin, WikidataField):
+    __slots__ = ()
     serializer_class = WikidataConformanceSerializer
     default_serializer_settings = {}
-
-    # def __init__(self, **kwargs):
-    #     super(WikidataLabelField, self).__init__(**kwargs)
-    #     self.from_name = "{}{}".format(self.entity_name, self.suffix)
-
-    def to_wikidata_field(self):
-        return ""
-
-    def to_wikidata_filter(self):
-        return ""
-
-    def to_wikidata_service(self):
-        return ""
-
-    def to_wikidata_group(self):
-        return ""
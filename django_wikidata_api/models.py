@@ -1,29 +1,136 @@
 # coding=utf-8
 """ Django-Style Wikidata Models. """
+import hashlib
+import json
 import logging
+import os
+import re
+import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from tempfile import gettempdir
+from time import monotonic, time
+from requests.adapters import HTTPAdapter
 from rest_framework.serializers import Serializer
+from urllib3.util.retry import Retry
 from wikidataintegrator.wdi_core import WDItemEngine
 
+try:
+    # Optional: 2-3x faster decode of large bindings arrays than the stdlib json module.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = None
+
+try:
+    # Optional: incremental parsing so unbounded result sets never hold the full response in memory.
+    import ijson
+except ImportError:
+    ijson = None
+
+from .constants import (
+    DEFAULT_LANGUAGE,
+    WIKIDATA_API_ENDPOINT,
+    WIKIDATA_ENTITY_PREFIX_URL,
+    WIKIDATA_SPARQL_ENDPOINT,
+    WIKIDATA_SPARQL_USER_AGENT
+)
 from .fields import (
     WikidataAltLabelField,
     WikidataConformanceField,
     WikidataEntityField,
     WikidataField,
-    WikidataLabelField
-)
-from .utils import (
-    dict_has_substring,
-    set_kwargs
+    WikidataLabelField,
+    render_fields
 )
+from .utils import set_kwargs
 from .viewsets import generate_wikidata_item_viewset
 
 _logger = logging.getLogger(__name__)
 
+# Property paths like "P31/wdt:P279*" are reduced to an alphanumeric suffix safe in a SPARQL var name.
+_VAR_SAFE_RE = re.compile(r'\W+')
+# Distinguishes the VALUES variables of triples sharing a property; see WDTriple.__init__.
+_wd_triple_counter = count()
+# Whitespace runs collapsed in one pass when minifying query templates.
+_WS_RE = re.compile(r'\s+')
+
+# Bindings keyed by minified query string as (stored_at, bindings); consulted only by models that
+# opt in via query_cache_ttl, since serving stale rows must be a per-model decision.
+_query_cache = {}
+_query_cache_lock = threading.Lock()
+_QUERY_CACHE_MAXSIZE = 256
+
+# ShEx conformance results keyed by (entity id, schema); a conformance verdict only changes when the
+# entity or schema does, so repeat checks across get/get_all calls become dict hits.
+_conformance_cache = {}
+_conformance_cache_lock = threading.Lock()
+_CONFORMANCE_CACHE_MAXSIZE = 1024
+
+# On-disk response cache shared by all processes on the host; consulted only by models that opt in
+# via disk_cache_ttl.
+_DISK_CACHE_DIR = os.path.join(gettempdir(), 'django_wikidata_api_cache')
+
+# In-flight queries by query string, so concurrent view threads issuing the same query share one
+# round-trip instead of stampeding WDQS.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+class _QueryFlight(object):
+    """ Coordination record for one in-flight query; followers wait on done and read the outcome. """
+    __slots__ = ('done', 'bindings', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.bindings = None
+        self.error = None
+
+
+# POST must be explicitly allowed: urllib3's default retryable-method set excludes it, and every
+# SPARQL query POSTs. Safe here because the queries are read-only SELECTs.
+try:
+    _retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                   allowed_methods=frozenset({'GET', 'POST'}))
+except TypeError:
+    # urllib3 < 1.26 spells the option method_whitelist.
+    _retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                   method_whitelist=frozenset({'GET', 'POST'}))
+
+# Shared across all models so repeat queries reuse pooled keep-alive connections instead of paying a
+# fresh TLS/TCP handshake per call; gzip negotiation shrinks large label-heavy responses.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_retry))
+_SESSION.headers.update({
+    'Accept': 'application/sparql-results+json',
+    'Accept-Encoding': 'gzip',
+    'User-Agent': WIKIDATA_SPARQL_USER_AGENT,
+})
+
+
+class WikidataItemMeta(type):
+    """ Metaclass that binds each WikidataField to its attribute name when a model class is created. """
+
+    def __init__(cls, name, bases, namespace):
+        super(WikidataItemMeta, cls).__init__(name, bases, namespace)
+        for key, field in namespace.items():
+            if isinstance(field, WikidataField):
+                field.set_name(key)
+        # Discovery is deterministic from the class body, so warm the per-class field cache here;
+        # steady-state callers then always hit the cached tuples, never the MRO walk.
+        if hasattr(cls, 'get_fields'):
+            cls.get_fields()
+
+    @property
+    def objects(cls):
+        """ Fresh lazy queryset over this model, Django-manager style. """
+        return WikidataQuerySet(cls)
+
 
 # TODO: Add Language Support
 # TODO: Support nested model responses
 # TODO: (currently child must declare a "main" in order to build query in proper order)
-class WikidataItemBase(object):
+class WikidataItemBase(object, metaclass=WikidataItemMeta):
     """ Base Wikidata Item Model """
     model_name = 'Wikidata Item'
     model_name_plural = 'Wikidata Items'
@@ -31,13 +138,20 @@ class WikidataItemBase(object):
     label = WikidataLabelField(required=True)
     alt_labels = WikidataAltLabelField()
     schema = None
+    # Seconds to serve repeated identical queries from the in-process cache; None disables caching.
+    query_cache_ttl = None
+    # Opt-in: route get_many through the faster wbgetentities API when the fields allow it.
+    wbgetentities_enabled = False
+    # Seconds to serve repeated queries from the on-disk response cache; None disables it. Unlike
+    # query_cache_ttl this survives process restarts (dev servers, management commands).
+    disk_cache_ttl = None
     # Instance Attributes set dynamically:
     id = None
     conformance = WikidataConformanceField()
 
     def __init__(self, **kwargs):
-        for key, field in self.get_fields(with_keys=True):
-            field.name = key
+        # Field names are bound once by the metaclass; instances only need their attribute defaults.
+        for key, _ in self.get_fields(with_keys=True):
             setattr(self, key, None)
         set_kwargs(self, kwargs)
 
@@ -45,39 +159,74 @@ class WikidataItemBase(object):
     def get_fields(cls, with_keys=False):
         """
         Get all fields associated with this model.
+        Notes:
+            The MRO walk only depends on the class, so its result is cached in the class __dict__
+            (per subclass) the first time and reused by every query build and response row parse.
         Args:
-            with_keys (Optional[bool]): True to make the return zipped tuples by keys,
+            with_keys (Optional[bool]): True to make the return (key, field) tuples,
                                         False if iterable fields
 
-        Returns (Union[zip[str, WikidataField], List[WikidataField]]):
+        Returns (Union[Tuple[Tuple[str, WikidataField]], List[WikidataField]]):
 
         """
-        fields = []
-        keys = []
-        for sub_cls in cls.__mro__:
-            for key, field in sub_cls.__dict__.items():
-                if isinstance(field, WikidataField) and key not in keys:
-                    keys.append(key)
-                    fields.append(field)
-        return zip(keys, fields) if with_keys else fields
+        cached = cls.__dict__.get('_fields_cache')
+        if cached is None:
+            # An insertion-ordered dict keyed by attribute name replaces the list + membership scan.
+            seen = {}
+            for sub_cls in cls.__mro__:
+                if sub_cls is object:
+                    # object is always last in the MRO and can hold no WikidataField.
+                    break
+                for key, field in vars(sub_cls).items():
+                    if isinstance(field, WikidataField) and key not in seen:
+                        seen[key] = field
+            cached = (tuple(seen.items()), tuple(seen.values()))
+            cls._fields_cache = cached
+        return cached[0] if with_keys else cached[1]
+
+    @classmethod
+    def get_public_field_keys(cls):
+        """
+        Get the attribute names of this model's public fields.
+        Notes:
+            Computed once per class from the cached field pairs; consumers iterate the tuple directly
+            instead of re-running per-attribute getattr/isinstance checks.
+
+        Returns (Tuple[str]):
+
+        """
+        keys = cls.__dict__.get('_public_field_keys_cache')
+        if keys is None:
+            keys = tuple(key for key, field in cls.get_fields(with_keys=True) if field.public)
+            cls._public_field_keys_cache = keys
+        return keys
 
     @classmethod
     def build_serializer(cls):
         """
         Build a serializer class to support this object.
+        Notes:
+            Synthesizing a DRF serializer class is metaclass-heavy work that only depends on the
+            model's fields, so the result is cached per class like the field and template caches.
         Returns (Class[Serializer]):
 
         """
-        attrs = {}
-        for key, field in cls.get_fields(with_keys=True):
-            # TODO: Addd documentation explaining relationship between main and id
-            if key == 'main':
-                key = 'id'
-            attrs[key] = field.serializer
-        return type('{}Serializer'.format(cls.__name__), (Serializer,), attrs)
+        serializer_cls = cls.__dict__.get('_serializer_cls_cache')
+        if serializer_cls is None:
+            attrs = {}
+            for key, field in cls.get_fields(with_keys=True):
+                if not field.public:
+                    continue
+                # TODO: Addd documentation explaining relationship between main and id
+                if key == 'main':
+                    key = 'id'
+                attrs[key] = field.serializer
+            serializer_cls = type('{}Serializer'.format(cls.__name__), (Serializer,), attrs)
+            cls._serializer_cls_cache = serializer_cls
+        return serializer_cls
 
     @classmethod
-    def get_all(cls, with_conformance=False, limit=None):
+    def get_all(cls, with_conformance=False, limit=None, page=None, page_size=100):
         """
         Query Wikidata to get all instances of this model.
         Notes:
@@ -85,12 +234,76 @@ class WikidataItemBase(object):
         Args:
             with_conformance (Optional[Bool]): True if intending to use SheX validation, False otherwise
             limit (Optional[Int]): The maximum records to query Wikidata for
+            page (Optional[Int]): 1-indexed page to fetch as a single bounded query; None fetches all
+            page_size (Optional[Int]): Records per page when page is given
 
         Returns (List[WikidataItemBase]): Returns a list of this model's instances
 
         """
-        wikidata_response = cls._query_wikidata(limit=limit)
-        return [cls._from_wikidata(x, with_conformance) for x in wikidata_response]
+        # A requested page is one bounded query; there is deliberately no page-walking loop here, so
+        # the per-page path carries no loop-termination arithmetic or repeated type checks.
+        offset = None
+        if page is not None:
+            if page < 1:
+                raise ValueError(f"page must be >= 1, got {page}")
+            limit = page_size
+            offset = (page - 1) * page_size or None
+        wikidata_response = cls._query_wikidata(limit=limit, offset=offset)
+        if with_conformance and cls.schema:
+            # Each schema-backed conformance check is a blocking network call; run them across a
+            # small thread pool instead of serially per row. The schema-less path stays inline
+            # since set_conformance is then just a local assignment.
+            items = list(cls._merge_duplicates(cls._from_wikidata(x) for x in wikidata_response))
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                # Consumed so worker exceptions propagate here.
+                list(executor.map(cls.set_conformance, items))
+            return items
+        items = (cls._from_wikidata(x, with_conformance) for x in wikidata_response)
+        return list(cls._merge_duplicates(items))
+
+    @classmethod
+    def iter_all(cls, with_conformance=False, limit=None):
+        """
+        Stream all instances of this model without materializing the full result list.
+        Notes:
+            Rows come from the streaming bindings iterator, so with ijson installed neither the raw
+            response nor the parsed instances are ever all in memory at once; callers that stop early
+            stop the parse early too.
+        Args:
+            with_conformance (Optional[Bool]): True if intending to use SheX validation, False otherwise
+            limit (Optional[Int]): The maximum records to query Wikidata for
+
+        Returns (Iterator[WikidataItemBase]):
+
+        """
+        items = (cls._from_wikidata(row, with_conformance) for row in cls._iter_query_wikidata(limit=limit))
+        yield from cls._merge_duplicates(items)
+
+    @classmethod
+    def _merge_duplicates(cls, items):
+        """
+        Yield items in order, dropping rows that repeat an already-seen Wikidata Entity id.
+        Notes:
+            A set of seen ids keeps the pass O(1) per item with no intermediate dict, so the caller's
+            list holds each instance exactly once.
+        Args:
+            items (Iterable[WikidataItemBase]): Parsed model instances
+
+        Returns (Iterator[WikidataItemBase]):
+
+        """
+        seen = set()
+        seen_add = seen.add
+        count = 0
+        for item in items:
+            # One hash probe per row: the add is unconditional and the length tells us if it took.
+            seen_add(item.id)
+            if len(seen) == count:
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.debug("Dropping duplicate %s row for '%s'", cls.model_name, item.id)
+                continue
+            count += 1
+            yield item
 
     @classmethod
     def get(cls, entity_id, with_conformance=False):
@@ -106,11 +319,111 @@ class WikidataItemBase(object):
 
         """
 
-        wikidata_response = cls._query_wikidata((entity_id,), limit=1)
-        if wikidata_response:
-            return cls._from_wikidata(wikidata_response[0], with_conformance)
-        _logger.warning("Unable to find %s with Wikidata Entity ID '%s'", cls.model_name, entity_id)
-        return None
+        item = cls.get_many((entity_id,), with_conformance).get(entity_id)
+        if item is None:
+            _logger.warning("Unable to find %s with Wikidata Entity ID '%s'", cls.model_name, entity_id)
+        return item
+
+    @classmethod
+    def get_many(cls, entity_ids, with_conformance=False, chunk_size=None, max_workers=4):
+        """
+        Query Wikidata to get instances for several Wikidata Entity ids in one round-trip.
+        Notes:
+            A single VALUES query replaces the one-request-per-id cost of calling get() in a loop.
+            Chunked fetching is opt-in (the query service rate-limits aggressive clients); when
+            enabled, the GIL is released during each request so chunks genuinely overlap.
+        Args:
+            entity_ids (Iterable[str]): Wikidata Entity identifiers (ex. ["Q123", "Q321"])
+            with_conformance (Optional[Bool]): True if intending to use SheX validation, False otherwise
+            chunk_size (Optional[int]): Split the id list into VALUES queries of this size and fetch
+                                        them concurrently; None issues one query for all ids
+            max_workers (Optional[int]): Thread count for chunked fetching
+
+        Returns (Dict[str, WikidataItemBase]): Found instances keyed by Wikidata Entity id
+
+        """
+        entity_ids = tuple(entity_ids)
+        if not entity_ids:
+            # An empty VALUES clause would be dropped from the query, turning this into an
+            # unbounded fetch of every instance; no ids can only ever mean no items.
+            return {}
+        if cls.wbgetentities_enabled and cls._wbgetentities_compatible():
+            items = (cls._from_wikidata(row, with_conformance) for row in cls._query_wbgetentities(entity_ids))
+            return {item.id: item for item in items}
+        if chunk_size and len(entity_ids) > chunk_size:
+            chunks = [entity_ids[i:i + chunk_size] for i in range(0, len(entity_ids), chunk_size)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = executor.map(cls._query_wikidata, chunks)
+            rows = (row for response in responses for row in response)
+        else:
+            rows = cls._query_wikidata(entity_ids)
+        items = (cls._from_wikidata(row, with_conformance) for row in rows)
+        return {item.id: item for item in items}
+
+    @classmethod
+    def _wbgetentities_compatible(cls):
+        """
+        Whether every field of this model can be served by the wbgetentities API.
+        Notes:
+            An entity field carrying triples (ex. an instance-of constraint) disqualifies the model:
+            wbgetentities cannot evaluate the constraint, so the fast path would answer for any
+            existing id instead of only the ids the SPARQL query would match.
+        Returns (bool): True if all fields are unfiltered entity/label/alias-shaped or response-side only
+
+        """
+        def field_compatible(field):
+            if field.no_sparql:
+                return True
+            if isinstance(field, WikidataEntityField):
+                return not field.wikidata_filter
+            return isinstance(field, (WikidataLabelField, WikidataAltLabelField))
+
+        compatible = cls.__dict__.get('_wbgetentities_compatible_cache')
+        if compatible is None:
+            compatible = all(field_compatible(field) for field in cls.get_fields())
+            cls._wbgetentities_compatible_cache = compatible
+        return compatible
+
+    @classmethod
+    def _query_wbgetentities(cls, entity_ids):
+        """
+        Fetch label-shaped data for the given ids via the MediaWiki action API.
+        Notes:
+            wbgetentities answers in a fraction of typical WDQS latency and is not subject to WDQS
+            throttling; responses are reshaped into the bindings form the row parsers expect.
+        Args:
+            entity_ids (Tuple[str]): Wikidata Entity identifiers (ex. ("Q123", "Q321"))
+
+        Returns (List[Dict]): Rows shaped like SPARQL results->bindings entries
+
+        """
+        fields = cls.get_fields(with_keys=True)
+        rows = []
+        for start in range(0, len(entity_ids), 50):  # the action API caps ids at 50 per request
+            response = _SESSION.get(WIKIDATA_API_ENDPOINT, params={
+                'action': 'wbgetentities',
+                'format': 'json',
+                'ids': '|'.join(entity_ids[start:start + 50]),
+                'props': 'labels|aliases',
+                'languages': DEFAULT_LANGUAGE,
+            })
+            response.raise_for_status()
+            for entity_id, entity in response.json().get('entities', {}).items():
+                if 'missing' in entity:
+                    continue
+                row = {}
+                for key, field in fields:
+                    if field.no_sparql:
+                        continue
+                    if isinstance(field, WikidataAltLabelField):
+                        aliases = entity.get('aliases', {}).get(DEFAULT_LANGUAGE) or ()
+                        row[key] = {'value': field.separator.join(alias['value'] for alias in aliases)}
+                    elif isinstance(field, WikidataLabelField):
+                        row[key] = {'value': entity.get('labels', {}).get(DEFAULT_LANGUAGE, {}).get('value', '')}
+                    else:
+                        row[key] = {'value': WIKIDATA_ENTITY_PREFIX_URL + entity_id}
+                rows.append(row)
+        return rows
 
     @classmethod
     def search(cls, search_string):
@@ -122,41 +435,132 @@ class WikidataItemBase(object):
         Returns (List[WikidataItemBase]):
 
         """
-        return [obj for obj in cls.get_all() if obj._has_substring(search_string)]
+        # The SPARQL filter prunes non-matching rows server-side; the client-side token match is kept
+        # as the authority since it also covers derived attributes (ids, concatenated lists).
+        tokens = str(search_string).lower().split()
+        rows = cls._query_wikidata(search_string=search_string)
+        objects = cls._merge_duplicates(cls._from_wikidata(row) for row in rows)
+        return [obj for obj in objects if all(token in obj._search_blob for token in tokens)]
+
+    @classmethod
+    def search_many(cls, search_strings):
+        """
+        Run several substring searches against a single fetch of this model's instances.
+        Notes:
+            One SPARQL round-trip and one search-blob build per object serve every query, instead of
+            the round-trip-per-query cost of calling search() in a loop.
+        Args:
+            search_strings (Iterable[str]): Search strings, each matched like search()
+
+        Returns (Dict[str, List[WikidataItemBase]]): Matching instances keyed by search string
+
+        """
+        token_sets = [(search_string, str(search_string).lower().split()) for search_string in search_strings]
+        objects = cls.get_all()
+        return {
+            search_string: [obj for obj in objects if all(token in obj._search_blob for token in tokens)]
+            for search_string, tokens in token_sets
+        }
 
     @classmethod
-    def build_query(cls, values=None, limit=None):
+    def build_query(cls, values=None, limit=None, search_string=None, offset=None):
         """
         Build a SPARQL query to fetch data that instantiates instances of models from the Wikidata Query Service.
         Args:
             values (Optional[Iterable[str]]): list-like structure containing Wikidata Entity ID's, ex. ['Q123', 'Q321']
             limit (Optional[int]): used to set a maximum return value in the query
+            search_string (Optional[str]): substring match pushed into the query as a SPARQL FILTER
+            offset (Optional[int]): number of results to skip, for paginated queries
 
         Returns (str): minified SPARQL Query string
 
         """
-        # TODO: Add Offset
-        fields = cls().get_fields()
-        to_fields = ' '.join(f.to_wikidata_field() for f in fields)
-        to_filters = ' '.join(f.to_wikidata_filter() for f in fields)
-        to_services = ' '.join(f.to_wikidata_service() for f in fields)
-        to_group = ' '.join(f.to_wikidata_group() for f in fields)
-        value_filter = "VALUES (?main) {{ (wd:{vals}) }}".format(vals=") (wd:".join(val for val in values)) \
-            if values else ''
-        limit_by = f"LIMIT {limit}" if limit else ""
+        if values:
+            value_filter = "VALUES (?main) {{ (wd:{vals}) }}".format(vals=") (wd:".join(val for val in values))
+            query = cls._query_template().replace("__VALUES__", value_filter)
+        else:
+            query = cls._query_template().replace("__VALUES__ ", "")
+        if search_string:
+            query = query.replace("__SEARCH__", cls._build_search_filter(search_string))
+        else:
+            query = query.replace("__SEARCH__ ", "")
+        if (limit or offset) and not values:
+            # A stable sort only matters when the window is open-ended; VALUES queries are already
+            # bounded, and unpaginated queries shouldn't make the endpoint sort the full result set.
+            query = query.replace("__ORDER__", "ORDER BY ?main")
+        else:
+            query = query.replace("__ORDER__ ", "")
+        if limit:
+            query = query.replace("__LIMIT__", f"LIMIT {limit}")
+        else:
+            query = query.replace(" __LIMIT__", "")
+        if offset:
+            return query.replace("__OFFSET__", f"OFFSET {offset}")
+        return query.replace(" __OFFSET__", "")
+
+    @classmethod
+    def _build_search_filter(cls, search_string):
+        """
+        Build a SPARQL FILTER clause matching the entity id or label against each search token.
+        Args:
+            search_string (str): Raw search string; quotes and backslashes are escaped
+
+        Returns (str): FILTER clauses, one per whitespace-separated token
 
-        query = f"""
+        """
+        needle = str(search_string).replace("\\", "\\\\").replace('"', '\\"').lower()
+        label_var = cls.label.from_name
+        # Alt labels are matched through EXISTS with a locally-scoped variable: the OPTIONAL binding
+        # in the main pattern is unbound for rows without aliases, so filtering on it directly would
+        # prune rows whose only match is an alt label before the client-side check could see them.
+        return " ".join(
+            f'FILTER(CONTAINS(LCASE(STR(?main)), "{token}")'
+            f' || CONTAINS(LCASE(STR(?{label_var})), "{token}")'
+            f" || EXISTS {{ ?main skos:altLabel ?__search_alt . FILTER(lang(?__search_alt)='{DEFAULT_LANGUAGE}'"
+            f' && CONTAINS(LCASE(STR(?__search_alt)), "{token}")) }}).'
+            for token in needle.split()
+        )
+
+    @classmethod
+    def _query_template(cls):
+        """
+        Build the SPARQL query skeleton shared by every query for this model.
+        Notes:
+            The skeleton only depends on the class's fields, so it is computed once per class (cached in
+            the class __dict__ so subclasses don't share a parent's template) and build_query just
+            substitutes the per-call VALUES/LIMIT markers.
+
+        Returns (str): minified SPARQL query template with __VALUES__ and __LIMIT__ placeholders
+
+        """
+        template = cls.__dict__.get('_query_template_cache')
+        if template is None:
+            fields = []
+            for key, field in cls.get_fields(with_keys=True):
+                # No need to build an instance just to walk the class's fields; bind names in place.
+                if field.name != key:
+                    field.set_name(key)
+                fields.append(field)
+            to_fields, to_filters, to_services, to_group = render_fields(fields)
+            template = f"""
                 SELECT DISTINCT {to_fields}
                 WHERE {{
-                    {value_filter}
+                    __VALUES__
                     {to_filters}
-                    SERVICE wikibase:label {{ bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". {to_services} }}
+                    __SEARCH__
+                    SERVICE wikibase:label {{
+                        bd:serviceParam wikibase:language "[AUTO_LANGUAGE],{DEFAULT_LANGUAGE}".
+                        {to_services}
+                    }}
                 }}
                 GROUP BY {to_group}
-                {limit_by}
+                __ORDER__ __LIMIT__ __OFFSET__
 
             """
-        return " ".join(query.split())
+            # One regex pass instead of split+join, which allocates an intermediate token list.
+            template = _WS_RE.sub(' ', template).strip()
+            cls._query_template_cache = template
+        return template
 
     @classmethod
     def get_viewset_urls(cls, slug='wikidata_item'):
@@ -174,19 +578,163 @@ class WikidataItemBase(object):
         return generate_wikidata_item_viewset(cls, slug)
 
     @classmethod
-    def _query_wikidata(cls, values=None, limit=None):
+    def _query_wikidata(cls, values=None, limit=None, search_string=None, offset=None):
         """
         Query Wikidata for data related to this model.
         Args:
             values (Optional[Iterable[str]]): list-like structure containing Wikidata Entity ID's, ex. ['Q123', 'Q321']
             limit (Optional[int]): used to set a maximum return value in the query
+            search_string (Optional[str]): substring match pushed into the query as a SPARQL FILTER
+            offset (Optional[int]): number of results to skip, for paginated queries
 
         Returns (List[Dict]]): The results->bindings of the Wikidata Query Service response
 
         """
         # TODO: Add some custom error handling
-        results_json = WDItemEngine.execute_sparql_query(cls.build_query(values, limit))
-        return results_json['results']['bindings']
+        query = cls.build_query(values, limit, search_string, offset)
+        ttl = cls.query_cache_ttl
+        if ttl:
+            cached = _query_cache.get(query)
+            if cached is not None and monotonic() - cached[0] < ttl:
+                return cached[1]
+        with _inflight_lock:
+            flight = _inflight.get(query)
+            leader = flight is None
+            if leader:
+                _inflight[query] = flight = _QueryFlight()
+        if not leader:
+            # Another thread is already executing this exact query; wait for it and share its rows.
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.bindings
+        try:
+            bindings = cls._execute_query(query)['results']['bindings']
+        except Exception as error:
+            flight.error = error
+            raise
+        else:
+            flight.bindings = bindings
+        finally:
+            with _inflight_lock:
+                _inflight.pop(query, None)
+            flight.done.set()
+        if ttl:
+            # Evict-and-insert under a lock: concurrent stores can otherwise race min() against a
+            # resizing dict or both pop the same victim.
+            with _query_cache_lock:
+                if len(_query_cache) >= _QUERY_CACHE_MAXSIZE:
+                    oldest = min(_query_cache, key=lambda key: _query_cache[key][0], default=None)
+                    _query_cache.pop(oldest, None)
+                _query_cache[query] = (monotonic(), bindings)
+        return bindings
+
+    @classmethod
+    def clear_query_cache(cls):
+        """ Drop all cached query results (shared across models). """
+        _query_cache.clear()
+
+    @classmethod
+    def _iter_query_wikidata(cls, values=None, limit=None):
+        """
+        Stream the bindings of a SPARQL query for this model, one row at a time.
+        Notes:
+            With ijson installed, rows are parsed incrementally off the response stream so an
+            unbounded query never materializes the full bindings array; without it this degrades
+            gracefully to iterating the fully-parsed response.
+        Args:
+            values (Optional[Iterable[str]]): list-like structure containing Wikidata Entity ID's
+            limit (Optional[int]): used to set a maximum return value in the query
+
+        Returns (Iterator[Dict]): The results->bindings rows of the response
+
+        """
+        query = cls.build_query(values, limit)
+        if ijson is None:
+            yield from cls._execute_query(query)['results']['bindings']
+            return
+        response = _SESSION.post(WIKIDATA_SPARQL_ENDPOINT, data={'query': query}, stream=True)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, 'results.bindings.item')
+
+    @classmethod
+    def _execute_query(cls, query):
+        """
+        Execute a SPARQL query against the Wikidata Query Service.
+        Notes:
+            POSTs through a module-level pooled session (keep-alive, gzip, retries) rather than
+            WDItemEngine.execute_sparql_query, which opens a fresh connection per call.
+        Args:
+            query (str): SPARQL query string
+
+        Returns (Dict): Parsed SPARQL JSON response
+
+        """
+        ttl = cls.disk_cache_ttl
+        if ttl:
+            cached = cls._read_disk_cache(query, ttl)
+            if cached is not None:
+                return cached
+        response = _SESSION.post(WIKIDATA_SPARQL_ENDPOINT, data={'query': query})
+        response.raise_for_status()
+        results = _json_loads(response.content) if _json_loads is not None else response.json()
+        if ttl:
+            cls._write_disk_cache(query, results)
+        return results
+
+    @classmethod
+    def _disk_cache_path(cls, query):
+        digest = hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+        return os.path.join(_DISK_CACHE_DIR, f"{digest}.json")
+
+    @classmethod
+    def _read_disk_cache(cls, query, ttl):
+        path = cls._disk_cache_path(query)
+        try:
+            if time() - os.path.getmtime(path) < ttl:
+                with open(path) as cache_file:
+                    return json.load(cache_file)
+        except (OSError, ValueError):
+            # Missing, expired-and-removed, or corrupt entries all mean a cache miss.
+            pass
+        return None
+
+    @classmethod
+    def _write_disk_cache(cls, query, results):
+        path = cls._disk_cache_path(query)
+        try:
+            os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as cache_file:
+                json.dump(results, cache_file)
+            # Atomic replace so concurrent readers never see a partially-written entry.
+            os.replace(tmp_path, path)
+        except OSError:
+            # A failed cache write must never break the query that produced the results.
+            _logger.debug("Unable to write query disk cache at '%s'", path, exc_info=True)
+
+    @classmethod
+    def _row_parsers(cls):
+        """
+        Get the (attribute name, parser) plan used to turn one response row into an instance.
+        Notes:
+            Computed once per class; the bound from_wikidata methods are captured so the per-row loop
+            avoids a descriptor lookup per field per row.
+
+        Returns (Tuple[Tuple[str, Callable]]):
+
+        """
+        parsers = cls.__dict__.get('_row_parsers_cache')
+        if parsers is None:
+            parsers = []
+            for key, field in cls.get_fields(with_keys=True):
+                if field.name != key:
+                    field.set_name(key)
+                parsers.append((key, field.from_wikidata))
+            parsers = tuple(parsers)
+            cls._row_parsers_cache = parsers
+        return parsers
 
     @classmethod
     def _from_wikidata(cls, wikidata_response, with_conformance=False):
@@ -199,15 +747,28 @@ class WikidataItemBase(object):
         Returns (WikidataItemBase):
 
         """
-        obj = cls()
-        for field in cls.get_fields():
-            setattr(obj, field.name, field.from_wikidata(wikidata_response))
+        # __new__ skips __init__'s per-field None initialization; every field is assigned just below.
+        # Instances are plain dict-backed objects with no data descriptors on field names, so a bulk
+        # __dict__.update is safe and skips the descriptor protocol that setattr pays per attribute.
+        obj = cls.__new__(cls)
+        obj.__dict__.update({name: parse(wikidata_response) for name, parse in cls._row_parsers()})
         obj.id = obj.main
         assert obj.id, "Wikidata Item Must Have Identifier"
         return obj.set_conformance() if with_conformance else obj
 
+    @property
+    def _search_blob(self):
+        """ Lowercased haystack of the id and public field values, built once and cached per instance. """
+        blob = self.__dict__.get('_search_blob_cache')
+        if blob is None:
+            values = [str(self.id)]
+            values.extend(str(getattr(self, key, '')) for key in self.get_public_field_keys())
+            blob = self.__dict__['_search_blob_cache'] = "\n".join(values).lower()
+        return blob
+
     def _has_substring(self, substring):
-        return dict_has_substring(self.__dict__, substring)
+        blob = self._search_blob
+        return all(token in blob for token in str(substring).lower().split())
 
     def __repr__(self):
         return "<{}: {}>".format(self.model_name, self.__str__())
@@ -217,7 +778,17 @@ class WikidataItemBase(object):
 
     def set_conformance(self):
         if self.schema:
-            self.conformance = WDItemEngine.check_shex_conformance(self.id, self.schema, output="all")
+            key = (self.id, str(self.schema))
+            conformance = _conformance_cache.get(key)
+            if conformance is None:
+                conformance = WDItemEngine.check_shex_conformance(self.id, self.schema, output="all")
+                # get_all fans set_conformance across a thread pool, so evict-and-insert must not
+                # race: guard it and tolerate a victim another worker already removed.
+                with _conformance_cache_lock:
+                    if len(_conformance_cache) >= _CONFORMANCE_CACHE_MAXSIZE:
+                        _conformance_cache.pop(next(iter(_conformance_cache), None), None)
+                    _conformance_cache[key] = conformance
+            self.conformance = conformance
         else:
             _logger.debug("No schema associated with this model: Setting result to 'n/a' "
                           "(Consider adding a model schema before using this functionality)")
@@ -229,13 +800,108 @@ class WikidataItemBase(object):
         return self
 
 
+class WikidataQuerySet(object):
+    """ Lazy, chainable view over a model's Wikidata query; nothing is fetched until results are consumed. """
+
+    def __init__(self, model, values=None, limit=None, offset=None, search_string=None, with_conformance=False):
+        self.model = model
+        self._values = values
+        self._limit = limit
+        self._offset = offset
+        self._search_string = search_string
+        self._with_conformance = with_conformance
+        self._result_cache = None
+
+    def __repr__(self):
+        return "<WikidataQuerySet: {}>".format(self.model.model_name_plural)
+
+    def _clone(self, **overrides):
+        settings = {
+            'values': self._values,
+            'limit': self._limit,
+            'offset': self._offset,
+            'search_string': self._search_string,
+            'with_conformance': self._with_conformance,
+        }
+        settings.update(overrides)
+        return type(self)(self.model, **settings)
+
+    def all(self):
+        return self._clone()
+
+    def filter(self, values=None, search=None):
+        """
+        Narrow the queryset; constraints combine into the single SPARQL request sent on consumption.
+        Args:
+            values (Optional[Iterable[str]]): Wikidata Entity ID's to pin with a VALUES clause
+            search (Optional[str]): substring match pushed into the query as a SPARQL FILTER
+
+        Returns (WikidataQuerySet):
+
+        """
+        overrides = {}
+        if values is not None:
+            overrides['values'] = tuple(values)
+        if search is not None:
+            overrides['search_string'] = search
+        return self._clone(**overrides)
+
+    def limit(self, limit):
+        return self._clone(limit=limit)
+
+    def offset(self, offset):
+        return self._clone(offset=offset)
+
+    def with_conformance(self):
+        return self._clone(with_conformance=True)
+
+    def _fetch(self):
+        if self._result_cache is None:
+            model = self.model
+            rows = model._query_wikidata(self._values, self._limit, self._search_string, self._offset)
+            items = (model._from_wikidata(row, self._with_conformance) for row in rows)
+            self._result_cache = list(model._merge_duplicates(items))
+        return self._result_cache
+
+    def __iter__(self):
+        return iter(self._fetch())
+
+    def __len__(self):
+        return len(self._fetch())
+
+    def __getitem__(self, index):
+        return self._fetch()[index]
+
+
 class WDTriple(object):
+    # Triples are immutable after construction; slots keep the many per-model instances small.
+    __slots__ = ('prop', 'values', '_parts', '_formatted')
+
     def __init__(self, prop, values, subclass=False, minus=False):
         assert not (len(values) > 1 and minus), "Union and Minus should not be used in the same clause"
-        self.prop = "{}/wdt:P279*".format(prop) if subclass else prop
+        self.prop = f"{prop}/wdt:P279*" if subclass else prop
         self.values = values
-        query = " UNION ".join(f"{{{{ ?{{name}} wdt:{self.prop} wd:{val}.}}}}" for val in self.values)
-        self._query = f"MINUS {query}" if minus else query
+        if len(values) > 1:
+            # A VALUES block lets the endpoint satisfy the whole alternation with one index scan,
+            # where the equivalent UNION forces a branch per value through the query planner.
+            # The variable folds in the bound field name and a per-triple counter: two triples over
+            # the same property (or one triple formatted for two fields) must not share a variable,
+            # or their VALUES blocks join and each constraint silently filters the other.
+            var = f"{{name}}__v_{_VAR_SAFE_RE.sub('', self.prop)}_{next(_wd_triple_counter)}"
+            vals = " ".join(f"wd:{val}" for val in values)
+            query = f"{{ VALUES ?{var} {{ {vals} }} ?{{name}} wdt:{self.prop} ?{var}. }}"
+        else:
+            query = " UNION ".join(f"{{ ?{{name}} wdt:{self.prop} wd:{val}.}}" for val in self.values)
+            if minus:
+                # MINUS keeps the triple form: MINUS-over-VALUES has different scoping semantics.
+                query = f"MINUS {query}"
+        # Split once on the placeholder so format() is a plain join instead of a str.format template parse.
+        self._parts = query.split("{name}")
+        self._formatted = {}
 
     def format(self, field_name):
-        return self._query.format(name=field_name)
+        # A triple is usually formatted for one or two field names, so the joined form is kept.
+        formatted = self._formatted.get(field_name)
+        if formatted is None:
+            formatted = self._formatted[field_name] = field_name.join(self._parts)
+        return formatted
@@ -1,13 +1,24 @@
 # coding=utf-8
 """ Unit tests for models.py """
+import os
+import shutil
+import tempfile
+import threading
+import time
+
 from mock import patch
 from rest_framework.serializers import Serializer
 
 from django.test import TestCase
 from django.urls import URLResolver
 
-from django_wikidata_api.fields import WikidataField
+from django_wikidata_api import models as wikidata_models
+from django_wikidata_api.fields import (
+    WikidataEntityField,
+    WikidataField
+)
 from django_wikidata_api.models import (
+    WDTriple,
     WikidataItemBase
 )
 
@@ -93,7 +104,7 @@ class WikidataItemBaseTests(TestCase):
         self.assertEqual(serializer_data['conformance']['reason'], 'No Schema associated with this model')
         self.assertTrue(serializer_data['conformance']['result'])
 
-    @patch('django_wikidata_api.models.WDItemEngine.execute_sparql_query')
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
     def test_get_all(self, mocked_execute_query):
         mocked_execute_query.return_value = self.mocked_query_response_empty
         self.assertEqual(WikidataItemBase.get_all(), [])
@@ -114,7 +125,26 @@ class WikidataItemBaseTests(TestCase):
         self.assertEqual(output_list[1].alt_labels, ['alt name 1', 'alt name 2'])
         self.assertIsNone(output_list[1].conformance)
 
-    @patch('django_wikidata_api.models.WDItemEngine.execute_sparql_query')
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test_get_all__paginated(self, mocked_execute_query):
+        mocked_execute_query.return_value = self.mocked_query_response
+        WikidataItemBase.get_all(page=2, page_size=10)
+        query = mocked_execute_query.call_args[0][0]
+        self.assertIn("ORDER BY ?main", query)
+        self.assertIn("LIMIT 10 OFFSET 10", query)
+        # page 1 starts at the beginning, so no OFFSET clause is emitted
+        WikidataItemBase.get_all(page=1, page_size=10)
+        query = mocked_execute_query.call_args[0][0]
+        self.assertIn("LIMIT 10", query)
+        self.assertNotIn("OFFSET", query)
+
+    def test_get_all__invalid_page(self):
+        with self.assertRaises(ValueError):
+            WikidataItemBase.get_all(page=0)
+        with self.assertRaises(ValueError):
+            WikidataItemBase.get_all(page=-1)
+
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
     def test_get_all__with_conformance(self, mocked_execute_query):
         mocked_execute_query.return_value = self.mocked_query_response_empty
         self.assertEqual(WikidataItemBase.get_all(with_conformance=True), [])
@@ -139,7 +169,22 @@ class WikidataItemBaseTests(TestCase):
         self.assertEqual(output_list[1].conformance['reason'], 'No Schema associated with this model')
         self.assertTrue(output_list[1].conformance['result'])
 
-    @patch('django_wikidata_api.models.WDItemEngine.execute_sparql_query')
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test_iter_all(self, mocked_execute_query):
+        mocked_execute_query.return_value = self.mocked_query_response
+        with patch('django_wikidata_api.models.ijson', None):
+            iterator = WikidataItemBase.iter_all(limit=5)
+            # nothing is fetched until the caller starts consuming
+            mocked_execute_query.assert_not_called()
+            items = list(iterator)
+        self.assertEqual(len(items), 2)
+        self.assertIsInstance(items[0], WikidataItemBase)
+        self.assertEqual([item.id for item in items], ['Q123', 'Q321'])
+        self.assertEqual(items[0].label, 'Test Item')
+        self.assertEqual(items[1].alt_labels, ['alt name 1', 'alt name 2'])
+        self.assertIn("LIMIT 5", mocked_execute_query.call_args[0][0])
+
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
     def test_get(self, mocked_execute_query):
         mocked_execute_query.return_value = self.mocked_query_response_empty
         self.assertIsNone(WikidataItemBase.get('Q123'))
@@ -153,7 +198,7 @@ class WikidataItemBaseTests(TestCase):
         self.assertIsNone(output.conformance)
         self.assertEqual(output.alt_labels, [])
 
-    @patch('django_wikidata_api.models.WDItemEngine.execute_sparql_query')
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
     def test_get__with_conformance(self, mocked_execute_query):
         mocked_execute_query.return_value = self.mocked_query_response_empty
         self.assertIsNone(WikidataItemBase.get('Q123', with_conformance=True))
@@ -169,7 +214,193 @@ class WikidataItemBaseTests(TestCase):
         self.assertTrue(output.conformance['result'])
         self.assertEqual(output.alt_labels, [])
 
-    @patch('django_wikidata_api.models.WDItemEngine.execute_sparql_query')
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test_get_many(self, mocked_execute_query):
+        mocked_execute_query.return_value = self.mocked_query_response_empty
+        self.assertEqual(WikidataItemBase.get_many(('Q123', 'Q321')), {})
+
+        mocked_execute_query.return_value = self.mocked_query_response
+        output = WikidataItemBase.get_many(('Q123', 'Q321'))
+        self.assertEqual(set(output), {'Q123', 'Q321'})
+        self.assertIsInstance(output['Q123'], WikidataItemBase)
+        self.assertEqual(output['Q123'].label, 'Test Item')
+        self.assertEqual(output['Q321'].label, 'Some Other Item')
+        query = mocked_execute_query.call_args[0][0]
+        self.assertIn("VALUES (?main) { (wd:Q123) (wd:Q321) }", query)
+
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test_get_many__empty(self, mocked_execute_query):
+        # no ids means no items; in particular no unbounded query is sent
+        self.assertEqual(WikidataItemBase.get_many(()), {})
+        self.assertEqual(WikidataItemBase.get_many(iter(())), {})
+        mocked_execute_query.assert_not_called()
+
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test_get_many__chunked(self, mocked_execute_query):
+        mocked_execute_query.return_value = self.mocked_query_response
+        output = WikidataItemBase.get_many(('Q123', 'Q321'), chunk_size=1)
+        self.assertEqual(mocked_execute_query.call_count, 2)
+        queries = [call[0][0] for call in mocked_execute_query.call_args_list]
+        self.assertTrue(any("VALUES (?main) { (wd:Q123) }" in query for query in queries))
+        self.assertTrue(any("VALUES (?main) { (wd:Q321) }" in query for query in queries))
+        self.assertEqual(set(output), {'Q123', 'Q321'})
+
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test__query_wikidata__ttl_cache(self, mocked_execute_query):
+        class CachedItem(WikidataItemBase):
+            query_cache_ttl = 60
+
+        self.addCleanup(CachedItem.clear_query_cache)
+        mocked_execute_query.return_value = self.mocked_query_response
+        first = CachedItem._query_wikidata()
+        second = CachedItem._query_wikidata()
+        # a repeat of the same query inside the TTL is a dict hit, not a second round-trip
+        self.assertEqual(mocked_execute_query.call_count, 1)
+        self.assertIs(second, first)
+        # an entry aged past the TTL is re-executed instead of served stale
+        query = CachedItem.build_query()
+        stored_at, bindings = wikidata_models._query_cache[query]
+        wikidata_models._query_cache[query] = (stored_at - 61, bindings)
+        CachedItem._query_wikidata()
+        self.assertEqual(mocked_execute_query.call_count, 2)
+        # clearing the cache forces the next call back to the endpoint
+        CachedItem.clear_query_cache()
+        CachedItem._query_wikidata()
+        self.assertEqual(mocked_execute_query.call_count, 3)
+
+    def _run_single_flight(self, worker):
+        """ Start one leader and three followers on worker, parking the followers before release. """
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        threads[0].start()
+        self.assertTrue(self.query_started.wait(timeout=5))
+        flight = next(iter(wikidata_models._inflight.values()))
+        for thread in threads[1:]:
+            thread.start()
+        # Wait until the three followers are parked on the flight before letting the leader finish,
+        # so none of them can miss it and start a flight of their own.
+        deadline = time.time() + 5
+        while len(flight.done._cond._waiters) < 3 and time.time() < deadline:
+            time.sleep(0.001)
+        self.query_release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test__query_wikidata__single_flight(self, mocked_execute_query):
+        self.query_started = threading.Event()
+        self.query_release = threading.Event()
+
+        def slow_query(query):
+            self.query_started.set()
+            self.query_release.wait(timeout=5)
+            return self.mocked_query_response
+
+        mocked_execute_query.side_effect = slow_query
+        results = []
+        self._run_single_flight(lambda: results.append(WikidataItemBase._query_wikidata()))
+        # one round-trip serves all four concurrent identical queries
+        self.assertEqual(mocked_execute_query.call_count, 1)
+        self.assertEqual(len(results), 4)
+        for bindings in results:
+            self.assertEqual(bindings, self.mocked_query_response['results']['bindings'])
+        self.assertEqual(wikidata_models._inflight, {})
+
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test__query_wikidata__single_flight_error(self, mocked_execute_query):
+        self.query_started = threading.Event()
+        self.query_release = threading.Event()
+        boom = ValueError("WDQS exploded")
+
+        def failing_query(query):
+            self.query_started.set()
+            self.query_release.wait(timeout=5)
+            raise boom
+
+        mocked_execute_query.side_effect = failing_query
+        errors = []
+
+        def worker():
+            try:
+                WikidataItemBase._query_wikidata()
+            except ValueError as error:
+                errors.append(error)
+
+        self._run_single_flight(worker)
+        # the leader's exception reaches every follower; nobody retries the query themselves
+        self.assertEqual(mocked_execute_query.call_count, 1)
+        self.assertEqual(errors, [boom] * 4)
+        self.assertEqual(wikidata_models._inflight, {})
+
+    @patch('django_wikidata_api.models._SESSION.post')
+    def test__execute_query__disk_cache(self, mocked_post):
+        class DiskCachedItem(WikidataItemBase):
+            disk_cache_ttl = 60
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        mocked_post.return_value.raise_for_status.return_value = None
+        mocked_post.return_value.content = b''
+        mocked_post.return_value.json.return_value = self.mocked_query_response
+        query = "SELECT ?main WHERE { ?main wdt:P31 wd:Q5. }"
+        with patch('django_wikidata_api.models._DISK_CACHE_DIR', cache_dir), \
+                patch('django_wikidata_api.models._json_loads', None):
+            # first call hits the endpoint and writes the cache; the second is served from disk
+            self.assertEqual(DiskCachedItem._execute_query(query), self.mocked_query_response)
+            self.assertEqual(DiskCachedItem._execute_query(query), self.mocked_query_response)
+            self.assertEqual(mocked_post.call_count, 1)
+            # an entry older than the TTL is ignored and refetched
+            os.utime(DiskCachedItem._disk_cache_path(query), (0, 0))
+            self.assertEqual(DiskCachedItem._execute_query(query), self.mocked_query_response)
+            self.assertEqual(mocked_post.call_count, 2)
+            # a corrupt entry falls back to the endpoint instead of raising
+            with open(DiskCachedItem._disk_cache_path(query), 'w') as cache_file:
+                cache_file.write("{not json")
+            self.assertEqual(DiskCachedItem._execute_query(query), self.mocked_query_response)
+            self.assertEqual(mocked_post.call_count, 3)
+
+    def test__wbgetentities_compatible(self):
+        class PlainItem(WikidataItemBase):
+            pass
+
+        class FilteredItem(WikidataItemBase):
+            main = WikidataEntityField(triples=[WDTriple('P31', ('Q5',))], required=True)
+
+        # label-shaped models qualify; a triple-bearing entity field would lose its
+        # constraint on the wbgetentities path, so it must fall back to SPARQL
+        self.assertTrue(PlainItem._wbgetentities_compatible())
+        self.assertFalse(FilteredItem._wbgetentities_compatible())
+
+    @patch('django_wikidata_api.models._SESSION.get')
+    def test__query_wbgetentities(self, mocked_get):
+        mocked_get.return_value.raise_for_status.return_value = None
+        mocked_get.return_value.json.return_value = {
+            'entities': {
+                'Q123': {
+                    'labels': {'en': {'language': 'en', 'value': 'Test Item'}},
+                    'aliases': {'en': [{'language': 'en', 'value': 'Test'}, {'language': 'en', 'value': 'Item'}]}
+                },
+                'Q321': {'labels': {'fr': {'language': 'fr', 'value': 'Autre'}}, 'aliases': {}},
+                'Q999': {'id': 'Q999', 'missing': ''}
+            }
+        }
+        rows = WikidataItemBase._query_wbgetentities(('Q123', 'Q321', 'Q999'))
+        # missing entities are dropped, not returned as empty rows
+        self.assertEqual(len(rows), 2)
+        by_id = {row['main']['value']: row for row in rows}
+        found = by_id['http://www.wikidata.org/entity/Q123']
+        self.assertEqual(found['label']['value'], 'Test Item')
+        self.assertEqual(found['alt_labels']['value'], 'Test|Item')
+        # entities without a label/aliases in the default language degrade to empty values
+        label_less = by_id['http://www.wikidata.org/entity/Q321']
+        self.assertEqual(label_less['label']['value'], '')
+        self.assertEqual(label_less['alt_labels']['value'], '')
+        # the reshaped rows parse through the normal row parsers
+        item = WikidataItemBase._from_wikidata(found)
+        self.assertEqual(item.id, 'Q123')
+        self.assertEqual(item.label, 'Test Item')
+        self.assertEqual(item.alt_labels, ['Test', 'Item'])
+
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
     def test_search(self, mocked_execute_query):
         mocked_execute_query.return_value = self.mocked_query_response_empty
         self.assertEqual(WikidataItemBase.search("something"), [])
@@ -185,6 +416,20 @@ class WikidataItemBaseTests(TestCase):
         # search by alt_labels
         self.assertEqual(len(WikidataItemBase.search('alt name 2')), 1)
 
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test_search_many(self, mocked_execute_query):
+        # duplicated rows in the response must not duplicate objects in any result list
+        mocked_execute_query.return_value = {
+            'results': {'bindings': self.mocked_query_response['results']['bindings'] * 2}
+        }
+        output = WikidataItemBase.search_many(('test item', 'alt name', 'item', 'no such thing'))
+        # one fetch serves every search string
+        self.assertEqual(mocked_execute_query.call_count, 1)
+        self.assertEqual([obj.id for obj in output['test item']], ['Q123'])
+        self.assertEqual([obj.id for obj in output['alt name']], ['Q321'])
+        self.assertEqual([obj.id for obj in output['item']], ['Q123', 'Q321'])
+        self.assertEqual(output['no such thing'], [])
+
     def test_build_query(self):
         output = WikidataItemBase.build_query()
         # test minified
@@ -212,7 +457,7 @@ class WikidataItemBaseTests(TestCase):
         self.assertNotIn("\n", output)
         self.assertNotIn("\t", output)
 
-    @patch('django_wikidata_api.models.WDItemEngine.execute_sparql_query')
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
     def test__query_wikidata(self, mocked_execute_query):
         mocked_execute_query.return_value = self.mocked_query_response_empty
         self.assertEqual(WikidataItemBase._query_wikidata(), [])
@@ -247,6 +492,26 @@ class WikidataItemBaseTests(TestCase):
         self.assertEqual(output.conformance['reason'], 'No Schema associated with this model')
         self.assertTrue(output.conformance['result'])
 
+    @patch('django_wikidata_api.models.WikidataItemBase._execute_query')
+    def test_objects_queryset(self, mocked_execute_query):
+        mocked_execute_query.return_value = self.mocked_query_response
+        queryset = WikidataItemBase.objects.all()
+        self.assertEqual(mocked_execute_query.call_count, 0)
+        self.assertEqual(len(queryset), 2)
+        self.assertEqual(mocked_execute_query.call_count, 1)
+        self.assertEqual(queryset[0].id, 'Q123')
+        self.assertEqual(queryset[1].id, 'Q321')
+        # cached after first consumption
+        list(queryset)
+        self.assertEqual(mocked_execute_query.call_count, 1)
+
+        filtered = WikidataItemBase.objects.filter(values=('Q123',)).limit(1)
+        list(filtered)
+        self.assertEqual(mocked_execute_query.call_count, 2)
+        query = mocked_execute_query.call_args[0][0]
+        self.assertIn("VALUES (?main) { (wd:Q123) }", query)
+        self.assertIn("LIMIT 1", query)
+
     def test_get_viewset_urls(self):
         urls = WikidataItemBase.get_viewset_urls()
         self.assertIsInstance(urls, URLResolver)
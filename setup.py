@@ -22,11 +22,19 @@ setup(
         'djangorestframework>=3.10.3',
         'drf-yasg>=1.17',
         'mock',
+        # Used directly for the pooled SPARQL/API session, not just transitively.
+        'requests>=2.22',
         'wikidataintegrator>=0.4.2, <0.4.3',
         # Wikidataintegrator packages that aren't tied down
         'pandas>=0.25.2',
         'tqdm>=4.36.1',
     ],
+    extras_require={
+        # Faster JSON decoding of large SPARQL result sets; used automatically when installed.
+        'fastjson': ['orjson'],
+        # Incremental response parsing for constant-memory iteration over large result sets.
+        'streaming': ['ijson'],
+    },
     classifiers=[
         "Development Status :: 1 - Planning",
         "Natural Language :: English",